@@ -1,13 +1,97 @@
 """CumulusCI task to compress a directory path into a zip file."""
 
+import fnmatch
+import mmap
 import os
+import re
+import shutil
+import tempfile
 import zipfile
-from fnmatch import fnmatch
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from cumulusci.core.tasks import BaseTask
 from cumulusci.core.utils import process_list_arg
 
+try:
+    # ISA-L's zlib-compatible API is a much faster DEFLATE, when installed
+    from isal import isal_zlib as _deflate
+except ImportError:
+    _deflate = zlib
+
+# Static resource metadata written alongside the zip when include_meta is set
+_META_XML_BYTES = b"""<?xml version="1.0" encoding="UTF-8"?>
+<StaticResource xmlns="http://soap.sforce.com/2006/04/metadata">
+    <cacheControl>Public</cacheControl>
+    <contentType>application/zip</contentType>
+</StaticResource>"""
+
+# fnmatch ignores case wherever os.path.normcase folds it (Windows); the
+# compiled exclude matchers follow the same rule
+_CASE_INSENSITIVE = os.path.normcase("A") != "A"
+
+# String values of include_meta that count as True
+_TRUTHY_STRINGS = frozenset({"true", "1", "yes", "y", "on"})
+
+# Keys that mark a dict as a CumulusCI option definition rather than a value
+_DEFINITION_KEYS = frozenset({"description", "required", "default"})
+
+# zstd's zip method id; only built into zipfile from Python 3.14
+ZIP_ZSTANDARD = getattr(zipfile, "ZIP_ZSTANDARD", 93)
+
+# Values accepted by the compression option
+_COMPRESSION_METHODS = {
+    "deflated": zipfile.ZIP_DEFLATED,
+    "stored": zipfile.ZIP_STORED,
+    "zstd": ZIP_ZSTANDARD,
+}
+
+# (default, minimum, maximum) compresslevel per method. DEFLATE defaults to
+# its fastest level; higher levels buy little on bundles of images/fonts.
+# ISA-L only implements levels 0-3.
+_COMPRESSLEVELS = {
+    zipfile.ZIP_DEFLATED: (
+        1,
+        0,
+        9 if _deflate is zlib else _deflate.ISAL_BEST_COMPRESSION,
+    ),
+    ZIP_ZSTANDARD: (3, 1, 22),
+}
+
+# Already-compressed formats are stored as-is; DEFLATE can't shrink them
+_PRECOMPRESSED_SUFFIXES = frozenset(
+    {
+        ".br",
+        ".gif",
+        ".gz",
+        ".jpeg",
+        ".jpg",
+        ".mp3",
+        ".mp4",
+        ".pdf",
+        ".png",
+        ".webp",
+        ".woff",
+        ".woff2",
+        ".zip",
+    }
+)
+
+# Read size when streaming files into the archive
+_COPY_BUFSIZE = 128 * 1024
+
+# Files at least this large are memory-mapped and compressed in chunks to a
+# temporary file rather than read and compressed whole in memory
+_MMAP_MIN_SIZE = 4 * 1024 * 1024
+
+# Not every platform can release pages of a mapping early (Windows can't)
+_MADV_DONTNEED = getattr(mmap, "MADV_DONTNEED", None)
+
+# Below this many files a thread pool costs more than it saves
+_PARALLEL_MIN_FILES = 4
+
 
 class ZipPath(BaseTask):
     """Compress a user-defined path into a .zip file."""
@@ -29,32 +113,251 @@ class ZipPath(BaseTask):
             "description": "If True, create a .resource-meta.xml file alongside the zip file",
             "required": False,
         },
+        "compresslevel": {
+            "description": "Compression level: 0-9 for deflated, or 0-3 when isal is installed "
+            "(defaults to 1, fastest; 0 stores files uncompressed), 1-22 for zstd (defaults to 3)",
+            "required": False,
+        },
+        "compression": {
+            "description": "Compression method: deflated (default), stored, or zstd. "
+            "zstd needs the zipfile-zstd package before Python 3.14 and is only for "
+            "intermediate artifacts; Salesforce static resources must be deflated or stored",
+            "required": False,
+        },
     }
 
-    def _should_exclude(self, file_path, source_path, exclude_patterns):
-        """Check if a file or directory should be excluded based on patterns."""
-        if not exclude_patterns:
-            return False
+    def _compile_patterns(self, patterns):
+        """Combine glob patterns into a single compiled regex.
 
-        # Get relative path from source
-        try:
-            rel_path = file_path.relative_to(source_path)
-            rel_str = str(rel_path).replace("\\", "/")
-        except ValueError:
-            # If file_path is not relative to source_path, use absolute path
-            rel_str = str(file_path).replace("\\", "/")
-
-        # Check against each exclude pattern
-        for pattern in exclude_patterns:
-            # Normalize pattern separators
-            pattern = pattern.replace("\\", "/")
-            # Check if pattern matches
-            if fnmatch(rel_str, pattern) or fnmatch(
-                str(file_path.name), pattern
-            ):
-                return True
+        Returns None when there are no patterns so callers can skip matching.
+        """
+        if not patterns:
+            return None
+        return re.compile(
+            "|".join(fnmatch.translate(p) for p in patterns),
+            re.IGNORECASE if _CASE_INSENSITIVE else 0,
+        )
+
+    def _should_exclude(self, prefix, name, literal_names, basename_re, path_re):
+        """Check if a file or directory should be excluded based on patterns.
+
+        ``prefix`` is the forward-slash directory path (with trailing slash)
+        relative to the source directory and ``name`` is the entry's bare
+        name. Wildcard-free names such as ``node_modules`` are a set lookup;
+        other patterns without a slash are matched against the name next;
+        patterns containing a slash are only tried against the full relative
+        path when both fail. On case-insensitive platforms ``literal_names``
+        holds lowercased names.
+        """
+        if (name.lower() if _CASE_INSENSITIVE else name) in literal_names:
+            return True
+        if basename_re is not None and basename_re.match(name):
+            return True
+        if path_re is not None and path_re.match(prefix + name):
+            return True
         return False
 
+    def _iter_files(self, source_path, literal_names, basename_re, path_re):
+        """Yield (file path, archive name) for every non-excluded file.
+
+        Walks the tree with os.scandir, keeping each directory's relative
+        prefix on the stack so it never has to be recomputed. With no exclude
+        patterns configured the matcher is never called at all.
+        """
+        matchers = (literal_names, basename_re, path_re)
+        filtering = bool(literal_names or basename_re or path_re)
+        stack = [(str(source_path), "")]
+        while stack:
+            dir_path, prefix = stack.pop()
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        # Filter out excluded directories before walking into them
+                        if not (
+                            filtering and self._should_exclude(prefix, name, *matchers)
+                        ):
+                            stack.append((entry.path, prefix + name + "/"))
+                    elif entry.is_file() and not (
+                        filtering and self._should_exclude(prefix, name, *matchers)
+                    ):
+                        # The prefix already is the forward-slash archive path
+                        yield entry.path, prefix + name
+
+    def _compress_type(self, file_path, compression):
+        """Pick ZIP_STORED for already-compressed formats, else ``compression``."""
+        if os.path.splitext(file_path)[1].lower() in _PRECOMPRESSED_SUFFIXES:
+            return zipfile.ZIP_STORED
+        return compression
+
+    def _write_file(self, zipf, file_path, arcname):
+        """Stream a file into the archive in large chunks.
+
+        DEFLATE members go through the _deflate backend, the same as on the
+        thread pool, so every member of an archive is compressed alike.
+        Stored and zstd members use ZipFile.open().
+        """
+        zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+        zinfo.compress_type = self._compress_type(file_path, zipf.compression)
+        if zinfo.compress_type == zipfile.ZIP_DEFLATED:
+            # CRC is overwritten with correct data after processing the file
+            zinfo.CRC = 0
+            with open(file_path, "rb", buffering=0) as src:
+                chunks = iter(lambda: src.read(_COPY_BUFSIZE), b"")
+                self._write_compressed(
+                    zipf, zinfo, self._deflate_chunks(chunks, zinfo, zipf.compresslevel)
+                )
+            return
+        # ZipFile.open() doesn't apply the archive's level to a given ZipInfo
+        zinfo._compresslevel = zipf.compresslevel
+        with open(file_path, "rb", buffering=0) as src, zipf.open(zinfo, "w") as dst:
+            shutil.copyfileobj(src, dst, _COPY_BUFSIZE)
+
+    def _new_compressor(self, level):
+        """Return a raw DEFLATE compressor (no zlib header) for one member."""
+        return _deflate.compressobj(level, _deflate.DEFLATED, -15)
+
+    def _deflate_chunks(self, chunks, zinfo, level):
+        """Raw-DEFLATE an iterable of buffers with the _deflate backend.
+
+        Yields the compressed pieces, then fills in zinfo's CRC and sizes
+        once ``chunks`` is exhausted, so callers must consume it fully.
+        """
+        compressor = self._new_compressor(level)
+        crc = file_size = compress_size = 0
+        for chunk in chunks:
+            crc = _deflate.crc32(chunk, crc)
+            file_size += len(chunk)
+            data = compressor.compress(chunk)
+            if data:
+                compress_size += len(data)
+                yield data
+        data = compressor.flush(_deflate.Z_FINISH)
+        compress_size += len(data)
+        yield data
+        zinfo.CRC = crc
+        zinfo.file_size = file_size
+        zinfo.compress_size = compress_size
+
+    def _compress_file(self, file_path, arcname, level):
+        """DEFLATE a single file, returning (ZipInfo, compressed data).
+
+        The data is bytes for small files; files of at least _MMAP_MIN_SIZE
+        are compressed by _compress_mapped into a temporary file instead.
+        Runs on worker threads; zlib and ISA-L release the GIL while
+        compressing.
+        """
+        zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        if zinfo.file_size >= _MMAP_MIN_SIZE:
+            return zinfo, self._compress_mapped(file_path, zinfo, level)
+        with open(file_path, "rb") as src:
+            raw = src.read()
+        return zinfo, b"".join(self._deflate_chunks((raw,), zinfo, level))
+
+    def _mapped_chunks(self, mapped, view):
+        """Yield _COPY_BUFSIZE slices of a mapped file's memoryview."""
+        for offset in range(0, len(view), _COPY_BUFSIZE):
+            with view[offset : offset + _COPY_BUFSIZE] as chunk:
+                yield chunk
+            if _MADV_DONTNEED is not None:
+                # Unmap pages already consumed so a large file doesn't stay
+                # resident for the life of the mapping
+                mapped.madvise(_MADV_DONTNEED, offset, _COPY_BUFSIZE)
+
+    def _compress_mapped(self, file_path, zinfo, level):
+        """DEFLATE a large file through mmap into a temporary file.
+
+        The mapping is compressed in slices and the output goes to disk, so
+        neither the file nor its compressed form is held in memory whole.
+        Returns the temporary file, positioned at the start, with zinfo's
+        CRC and sizes filled in.
+        """
+        out = tempfile.TemporaryFile()
+        try:
+            with open(file_path, "rb") as src, mmap.mmap(
+                src.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mapped, memoryview(mapped) as view:
+                for data in self._deflate_chunks(
+                    self._mapped_chunks(mapped, view), zinfo, level
+                ):
+                    out.write(data)
+        except BaseException:
+            out.close()
+            raise
+        out.seek(0)
+        return out
+
+    def _write_compressed(self, zipf, zinfo, chunks):
+        """Append a member whose compressed data is produced by ``chunks``.
+
+        Mirrors ZipFile._open_to_write and _ZipWriteFile.close: the local
+        header is written first, then rewritten with the final CRC and sizes
+        once ``chunks`` has been written out.
+        """
+        # Compressed size can be larger than uncompressed size
+        zip64 = zinfo.file_size * 1.05 > zipfile.ZIP64_LIMIT
+        zinfo.flag_bits = 0x00
+        zinfo.header_offset = zipf.start_dir
+        zipf._writecheck(zinfo)
+        zipf._didModify = True
+        fp = zipf.fp
+        fp.seek(zinfo.header_offset)
+        fp.write(zinfo.FileHeader(zip64))
+        for data in chunks:
+            fp.write(data)
+        if not zip64 and zipfile.ZIP64_LIMIT < max(
+            zinfo.file_size, zinfo.compress_size
+        ):
+            raise RuntimeError(
+                f"File size grew past the ZIP64 limit while zipping: {zinfo.filename}"
+            )
+        zipf.start_dir = fp.tell()
+        fp.seek(zinfo.header_offset)
+        fp.write(zinfo.FileHeader(zip64))
+        fp.seek(zipf.start_dir)
+        zipf.filelist.append(zinfo)
+        zipf.NameToInfo[zinfo.filename] = zinfo
+
+    def _write_member(self, zipf, zinfo, data):
+        """Write a (ZipInfo, compressed data) pair from _compress_file."""
+        if isinstance(data, bytes):
+            self._write_compressed(zipf, zinfo, (data,))
+        else:
+            with data:
+                self._write_compressed(
+                    zipf, zinfo, iter(lambda: data.read(_COPY_BUFSIZE), b"")
+                )
+
+    def _write_parallel(self, zipf, files, level):
+        """DEFLATE files on a thread pool and append them in walk order.
+
+        At most twice the worker count is in flight. Only files below
+        _MMAP_MIN_SIZE are held in memory; larger ones are compressed to
+        temporary files. Stored members need no CPU, so the main thread
+        streams them with _write_file once everything queued ahead of them
+        is written.
+        """
+        workers = min(os.cpu_count() or 1, len(files))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for file_path, arcname in files:
+                if (
+                    self._compress_type(file_path, zipfile.ZIP_DEFLATED)
+                    == zipfile.ZIP_STORED
+                ):
+                    while pending:
+                        self._write_member(zipf, *pending.popleft().result())
+                    self._write_file(zipf, file_path, arcname)
+                    continue
+                pending.append(
+                    executor.submit(self._compress_file, file_path, arcname, level)
+                )
+                if len(pending) >= workers * 2:
+                    self._write_member(zipf, *pending.popleft().result())
+            while pending:
+                self._write_member(zipf, *pending.popleft().result())
+
     def _get_option_value(self, option_name):
         """Extract option value, handling both direct values and dict structures.
         
@@ -77,6 +380,10 @@ class ZipPath(BaseTask):
         if value is None:
             return None
         
+        # Strings are by far the most common case
+        if value.__class__ is str:
+            return value
+
         # If value is already a simple type (str, bool, int, etc.), return it
         if not isinstance(value, dict):
             return value
@@ -90,8 +397,7 @@ class ZipPath(BaseTask):
         
         # Check for common CumulusCI option definition keys
         # If it has these keys, it's likely a definition dict, not a value
-        definition_keys = {"description", "required", "default"}
-        if definition_keys.intersection(value.keys()):
+        if _DEFINITION_KEYS.intersection(value.keys()):
             # It's a definition dict - try to get the default
             default = value.get("default")
             if default is not None:
@@ -103,7 +409,7 @@ class ZipPath(BaseTask):
         # maybe that's the value? Unlikely but possible.
         if len(value) == 1:
             key = list(value.keys())[0]
-            if key not in definition_keys:
+            if key not in _DEFINITION_KEYS:
                 return value[key]
         
         # If we can't extract a value, log and return None
@@ -114,8 +420,10 @@ class ZipPath(BaseTask):
         return None
 
     def _run_task(self):
-        # Get path option, handling dict structures
-        path_value = self._get_option_value("path")
+        # Resolve every option once, handling dict structures
+        opts = {name: self._get_option_value(name) for name in self.task_options}
+
+        path_value = opts["path"]
         if not path_value:
             raise ValueError("path option is required")
         source_path = Path(path_value).resolve()
@@ -124,7 +432,7 @@ class ZipPath(BaseTask):
             raise FileNotFoundError(f"Path does not exist: {source_path}")
 
         # Determine output zip file path
-        output_value = self._get_option_value("output")
+        output_value = opts["output"]
         if output_value:
             output_path = Path(output_value).resolve()
         else:
@@ -139,56 +447,126 @@ class ZipPath(BaseTask):
 
         # Get exclude patterns
         exclude_patterns = []
-        exclude_value = self._get_option_value("exclude")
-        if exclude_value:
+        exclude_value = opts["exclude"]
+        if isinstance(exclude_value, (list, tuple)):
+            # Already a list when the task is driven from Python
+            exclude_patterns = exclude_value
+        elif exclude_value:
             exclude_patterns = process_list_arg(exclude_value)
+        # Normalize pattern separators once rather than per file
+        exclude_patterns = tuple(p.replace("\\", "/") for p in exclude_patterns)
+        # Patterns without a slash can only ever match an entry's name, and
+        # those without wildcards need no regex at all
+        name_patterns = [p for p in exclude_patterns if "/" not in p]
+        literal_patterns = [
+            p for p in name_patterns if not any(c in p for c in "*?[")
+        ]
+        literal_names = frozenset(
+            p.lower() if _CASE_INSENSITIVE else p for p in literal_patterns
+        )
+        basename_re = self._compile_patterns(
+            [p for p in name_patterns if p not in literal_patterns]
+        )
+        path_re = self._compile_patterns([p for p in exclude_patterns if "/" in p])
+
+        # Get compression method
+        compression_value = str(opts["compression"] or "deflated").lower()
+        compression = _COMPRESSION_METHODS.get(compression_value)
+        if compression is None:
+            raise ValueError(
+                f"compression must be one of {', '.join(_COMPRESSION_METHODS)}: "
+                f"{compression_value!r}"
+            )
+        if compression == ZIP_ZSTANDARD:
+            try:
+                # NotImplementedError before 3.14, RuntimeError on 3.14 builds
+                # without the compression.zstd module
+                zipfile._check_compression(compression)
+            except (NotImplementedError, RuntimeError):
+                try:
+                    # Registers ZIP_ZSTANDARD with the stdlib zipfile module
+                    import zipfile_zstd  # noqa: F401
+                except ImportError:
+                    raise ValueError(
+                        "compression 'zstd' requires the compression.zstd module "
+                        "(Python 3.14+) or the zipfile-zstd package"
+                    ) from None
+
+        # Get compression level
+        compresslevel = opts["compresslevel"]
+        if compression == zipfile.ZIP_STORED:
+            compresslevel = None
+        else:
+            default_level, min_level, max_level = _COMPRESSLEVELS[compression]
+            if compresslevel is None or compresslevel == "":
+                compresslevel = default_level
+            try:
+                compresslevel = int(compresslevel)
+            except (TypeError, ValueError):
+                raise ValueError(
+                    f"compresslevel must be an integer: {compresslevel!r}"
+                ) from None
+            if not min_level <= compresslevel <= max_level:
+                backend = ""
+                if compression == zipfile.ZIP_DEFLATED and _deflate is not zlib:
+                    backend = " with isal installed"
+                raise ValueError(
+                    f"compresslevel must be between {min_level} and {max_level} "
+                    f"for {compression_value}{backend}: {compresslevel}"
+                )
+            if compression == zipfile.ZIP_DEFLATED and compresslevel == 0:
+                # Level 0 means no compression; ISA-L's level 0 still
+                # compresses, so store the members instead
+                compression = zipfile.ZIP_STORED
+                compresslevel = None
 
         # Create the zip file
         self.logger.info(f"Compressing {source_path} to {output_path}")
 
-        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+        with zipfile.ZipFile(
+            output_path, "w", compression, compresslevel=compresslevel
+        ) as zipf:
             if source_path.is_file():
                 # If it's a single file, add it directly
-                if not self._should_exclude(source_path, source_path.parent, exclude_patterns):
-                    zipf.write(source_path, source_path.name)
+                name = source_path.name
+                if not (
+                    exclude_patterns
+                    and self._should_exclude(
+                        "", name, literal_names, basename_re, path_re
+                    )
+                ):
+                    self._write_file(zipf, source_path, name)
             else:
                 # If it's a directory, add all files recursively
-                for root, dirs, files in os.walk(source_path):
-                    # Filter out excluded directories before walking into them
-                    dirs[:] = [
-                        d
-                        for d in dirs
-                        if not self._should_exclude(
-                            Path(root) / d, source_path, exclude_patterns
-                        )
-                    ]
-
-                    for file in files:
-                        file_path = Path(root) / file
-
-                        if not self._should_exclude(file_path, source_path, exclude_patterns):
-                            # Calculate relative path for archive
-                            arcname = file_path.relative_to(source_path)
-                            zipf.write(file_path, arcname)
+                files = list(
+                    self._iter_files(source_path, literal_names, basename_re, path_re)
+                )
+                # Only DEFLATE benefits from the pool; stored and zstd archives
+                # go through zipfile's own streaming writer
+                if (
+                    len(files) < _PARALLEL_MIN_FILES
+                    or compression != zipfile.ZIP_DEFLATED
+                ):
+                    for file_path, arcname in files:
+                        self._write_file(zipf, file_path, arcname)
+                else:
+                    self._write_parallel(zipf, files, compresslevel)
 
         self.logger.info(f"Successfully created zip file: {output_path}")
 
         # Create meta.xml file if requested
-        include_meta = self._get_option_value("include_meta")
-        if include_meta is None:
-            include_meta = False
+        include_meta = opts["include_meta"]
         # Handle both boolean and string values
-        if isinstance(include_meta, str):
-            include_meta = include_meta.lower() in ("true", "1", "yes")
+        if include_meta is True:
+            pass
+        elif isinstance(include_meta, str):
+            include_meta = include_meta.lower() in _TRUTHY_STRINGS
+        else:
+            include_meta = bool(include_meta)
         if include_meta:
-            meta_content = """<?xml version="1.0" encoding="UTF-8"?>
-<StaticResource xmlns="http://soap.sforce.com/2006/04/metadata">
-    <cacheControl>Public</cacheControl>
-    <contentType>application/zip</contentType>
-</StaticResource>"""
             # Create meta.xml file with same name but .resource-meta.xml extension
             meta_path = output_path.with_suffix(".resource-meta.xml")
-            meta_path.write_text(meta_content, encoding="UTF-8")
+            meta_path.write_bytes(_META_XML_BYTES)
             self.logger.info(f"Created meta file: {meta_path}")
             self.return_values = {
                 "zip_path": str(output_path),